@@ -0,0 +1,76 @@
+import threading
+
+class DeadbandController:
+    """
+    Change-driven evaluation mode for any controller.
+
+    Wraps an object with compute(temp, hum) (MamdaniController, SugenoController, ...)
+    or a plain function such as fuzzy_controller.run_fuzzy. Inference only runs when
+    an input leaves its deadband around the last *evaluated* point; otherwise the
+    previous outputs are returned. Each zone keeps its own last evaluated point.
+
+    The cache and counters are guarded by a lock, so one instance can be shared
+    between threads as long as the wrapped controller is thread-safe itself
+    (the pooled controllers and run_fuzzy are). Inference runs outside the lock.
+    """
+
+    def __init__(self, controller, temp_band=0.1, hum_band=0.2):
+        self.controller = controller
+        self._compute = controller.compute if hasattr(controller, 'compute') else controller
+        self.temp_band = temp_band  # °C
+        self.hum_band = hum_band    # %RH
+        self._last = {}             # zone -> (temp, hum, outputs)
+        self.executed = 0
+        self.skipped = 0
+        self._lock = threading.Lock()
+
+    def compute(self, temp_input, hum_input, zone=None):
+        with self._lock:
+            last = self._last.get(zone)
+            if last is not None and abs(temp_input - last[0]) <= self.temp_band and abs(hum_input - last[1]) <= self.hum_band:
+                self.skipped += 1
+                return last[2]
+
+        outputs = self._compute(temp_input, hum_input)
+        with self._lock:
+            self._last[zone] = (temp_input, hum_input, outputs)
+            self.executed += 1
+        return outputs
+
+    def update_rules(self, new_rules):
+        """Replaces the wrapped controller's rules; cached outputs are no longer valid."""
+        self.controller.update_rules(new_rules)
+        self.reset()
+
+    def reset(self, zone=None):
+        """Forgets the last evaluated point (for one zone, or all zones)."""
+        with self._lock:
+            if zone is None:
+                self._last.clear()
+            else:
+                self._last.pop(zone, None)
+
+    def stats(self):
+        with self._lock:
+            executed, skipped = self.executed, self.skipped
+        total = executed + skipped
+        skip_ratio = skipped / total if total else 0.0
+        return {'executed': executed, 'skipped': skipped, 'skip_ratio': skip_ratio}
+
+    def __getstate__(self):
+        # Locks cannot be pickled (ProcessPoolExecutor, spawn); a fresh one is made on load
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name):
+        # Only called for missing attributes. Before __init__/__setstate__ has run
+        # (copy, pickle) 'controller' is missing too, so don't recurse looking for it.
+        if name == 'controller' or (name.startswith('__') and name.endswith('__')):
+            raise AttributeError(name)
+        # Delegate everything else (get_variables, rules, ...) to the wrapped controller
+        return getattr(self.controller, name)
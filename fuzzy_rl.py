@@ -2,9 +2,14 @@ import numpy as np
 import pickle
 import os
 from skfuzzy import control as ctrl
+from rule_analyzer import RuleAnalyzer
 
 class FuzzyRLAgent:
-    def __init__(self, sugeno_controller):
+    # Stored in the checkpoint next to the Q-table, epsilon, episode count and mode
+    HYPERPARAMETERS = ('alpha', 'gamma', 'epsilon_decay', 'epsilon_min')
+
+    def __init__(self, sugeno_controller, q_table_file='q_table.pkl'):
+        """q_table_file=None starts from scratch without reading or writing a checkpoint."""
         self.controller = sugeno_controller
         # Extract Fuzzy Sets for state discretization
         self.temp_mf = self.controller.temperature
@@ -25,37 +30,69 @@ class FuzzyRLAgent:
         
         # Q-Table: [Temp_State, Hum_State, Fan_Action, Mist_Action]
         # Dimensions: 5 x 5 x 3 x 3
-        self.q_table_file = 'q_table.pkl'
+        # Q-table and hyperparameters start at their defaults and are then
+        # overridden by a saved checkpoint, if any
+        self.reset_q_table()
+        self.q_table_file = q_table_file
         self.load_q_table()
-        
-        # Hyperparameters
-        self.alpha = 0.1  # Learning Rate
-        self.gamma = 0.9  # Discount Factor
-        self.epsilon = 1.0 # Exploration Rate
-        self.epsilon_decay = 0.995
-        self.epsilon_min = 0.01
 
     def load_q_table(self):
-        if os.path.exists(self.q_table_file):
+        if self.q_table_file is not None and os.path.exists(self.q_table_file):
             with open(self.q_table_file, 'rb') as f:
-                self.q_table = pickle.load(f)
-        else:
-            self.q_table = np.zeros((5, 5, 3, 3))
+                data = pickle.load(f)
+            if isinstance(data, dict):
+                # Checkpoint: resume exploration and episode count where training stopped
+                self.q_table = data['q_table']
+                self.epsilon = data['epsilon']
+                self.episodes_trained = data['episodes_trained']
+                self.mode = data.get('mode')  # Not stored by earlier checkpoints
+                for name, value in data['hyperparameters'].items():
+                    setattr(self, name, value)
+            else:
+                # Older files only hold the bare Q-table
+                self.q_table = data
 
     def save_q_table(self):
-        with open(self.q_table_file, 'wb') as f:
-            pickle.dump(self.q_table, f)
+        if self.q_table_file is None:
+            return  # Agent was built without a checkpoint file
+        checkpoint = {
+            'q_table': self.q_table,
+            'epsilon': self.epsilon,
+            'episodes_trained': self.episodes_trained,
+            'mode': self.mode,
+            'hyperparameters': {name: getattr(self, name) for name in self.HYPERPARAMETERS},
+        }
+        # Write then rename, so an interrupted save never leaves a truncated file
+        tmp_file = self.q_table_file + '.tmp'
+        with open(tmp_file, 'wb') as f:
+            pickle.dump(checkpoint, f)
+        os.replace(tmp_file, self.q_table_file)
+
+    def get_memberships(self, temp, hum):
+        # Membership degree of the reading in every temperature / humidity term
+        t_mfs = np.array([fuzz.interp_membership(self.temp_mf.universe, self.controller.temperature[label].mf, temp) for label in self.temp_labels])
+        h_mfs = np.array([fuzz.interp_membership(self.hum_mf.universe, self.controller.humidity[label].mf, hum) for label in self.hum_labels])
+        return t_mfs, h_mfs
 
     def get_state(self, temp, hum):
         # Discretize continuous input into fuzzy state based on max membership
-        # Ideally we compute membership for each and take argmax
-        t_mfs = [fuzz.interp_membership(self.temp_mf.universe, self.controller.temperature[label].mf, temp) for label in self.temp_labels]
-        h_mfs = [fuzz.interp_membership(self.hum_mf.universe, self.controller.humidity[label].mf, hum) for label in self.hum_labels]
+        t_mfs, h_mfs = self.get_memberships(temp, hum)
         
         t_idx = np.argmax(t_mfs)
         h_idx = np.argmax(h_mfs)
         return t_idx, h_idx
 
+    def get_fuzzy_state(self, temp, hum):
+        """Normalized firing strength of every (temp, hum) state as a 5x5 matrix."""
+        t_mfs, h_mfs = self.get_memberships(temp, hum)
+        weights = np.outer(t_mfs, h_mfs)
+        total = weights.sum()
+        if total == 0:
+            # Outside every MF: fall back to the crisp argmax state
+            weights[np.argmax(t_mfs), np.argmax(h_mfs)] = 1.0
+            return weights
+        return weights / total
+
     def choose_action(self, t_idx, h_idx):
         if np.random.random() < self.epsilon:
             fan_idx = np.random.randint(0, 3)
@@ -68,6 +105,55 @@ class FuzzyRLAgent:
             mist_idx = best_action_flat % 3
         return fan_idx, mist_idx
 
+    def fuzzy_q_values(self, weights):
+        # Q-values of the 3x3 actions blended over all active states
+        return np.einsum('th,thfm->fm', weights, self.q_table)
+
+    def choose_action_fuzzy(self, weights):
+        if np.random.random() < self.epsilon:
+            fan_idx = np.random.randint(0, 3)
+            mist_idx = np.random.randint(0, 3)
+        else:
+            best_action_flat = np.argmax(self.fuzzy_q_values(weights))
+            fan_idx = best_action_flat // 3
+            mist_idx = best_action_flat % 3
+        return fan_idx, mist_idx
+
+    def fuzzy_update(self, weights, action, reward, next_weights):
+        """Fuzzy Q-learning: the TD error is shared by all active states in proportion to their firing strength."""
+        fan_idx, mist_idx = action
+        
+        best_next_q = np.max(self.fuzzy_q_values(next_weights))
+        current_q = np.sum(weights * self.q_table[:, :, fan_idx, mist_idx])
+        
+        td_error = reward + self.gamma * best_next_q - current_q
+        self.q_table[:, :, fan_idx, mist_idx] += self.alpha * td_error * weights
+
+    def evaluate(self, env, mode='tabular', episodes=10, steps=50, seed=1234):
+        """
+        Mean per-step reward of the greedy policy (no exploration, no learning) over
+        `episodes` rollouts. The rollouts use their own seed, so every call starts from
+        the same initial states, and numpy's global random state is restored afterwards.
+        """
+        rng_state = np.random.get_state()
+        np.random.seed(seed)
+        total = 0.0
+        for _ in range(episodes):
+            temp, hum = env.reset()
+            for _ in range(steps):
+                if mode == 'fuzzy':
+                    q = self.fuzzy_q_values(self.get_fuzzy_state(temp, hum))
+                else:
+                    t_idx, h_idx = self.get_state(temp, hum)
+                    q = self.q_table[t_idx, h_idx]
+                best_action_flat = np.argmax(q)
+                fan_pwm = [20, 50, 80][best_action_flat // 3]
+                mist_pwm = [20, 50, 80][best_action_flat % 3]
+                (temp, hum), reward, _, _ = env.step(fan_pwm, mist_pwm)
+                total += reward
+        np.random.set_state(rng_state)
+        return total / (episodes * steps)
+
     def update(self, state, action, reward, next_state):
         t_idx, h_idx = state
         fan_idx, mist_idx = action
@@ -79,14 +165,53 @@ class FuzzyRLAgent:
         new_q = current_q + self.alpha * (reward + self.gamma * best_next_q - current_q)
         self.q_table[t_idx, h_idx, fan_idx, mist_idx] = new_q
 
-    def train(self, env, episodes=1000):
-        print(f"Starting training for {episodes} episodes...")
+    def train(self, env, episodes=1000, mode='tabular', save=True, early_stop=True,
+              checkpoint_every=100, eval_every=25, eval_episodes=5, stop_window=8,
+              stop_band=0.15, q_change_tol=0.07):
+        """
+        mode='tabular' updates only the argmax state of each reading; mode='fuzzy'
+        spreads every update over all active states by firing strength. Q-values of the
+        two modes mean different things, so a checkpoint is only resumed in its own mode.
+
+        Training resumes from the loaded epsilon and episode count and, with save=True,
+        checkpoints every `checkpoint_every` episodes.
+
+        Every `eval_every` episodes the greedy policy is scored with evaluate() over
+        `eval_episodes` episodes (5 x 50 steps every 25 episodes adds about 20% to the
+        simulation time); returns the list of (episode of this run, greedy return) pairs.
+
+        With early_stop, checked at each evaluation over the last stop_window * eval_every
+        episodes, training ends once either
+        - the last `stop_window` scores all lie within stop_band * |their mean|, or
+        - the Q-values moved less than q_change_tol * max|Q| per episode on average.
+        Tabular runs usually stop on the first test; in fuzzy mode the greedy return keeps
+        oscillating, so fuzzy runs stop on the second, typically after 850-950 episodes.
+        eval_every=0 disables both evaluation and early stopping.
+        """
+        if self.mode is not None and self.mode != mode:
+            raise ValueError(f"Q-table was trained in '{self.mode}' mode and cannot be resumed in '{mode}' mode; "
+                             f"call reset_q_table() to start over.")
+        if self.mode is None and np.any(self.q_table):
+            # Q-tables saved before the mode was recorded
+            print(f"Warning: loaded Q-table does not record its training mode; resuming it as '{mode}'.")
+        self.mode = mode
+
+        print(f"Starting {mode} training for up to {episodes} episodes (resuming at episode {self.episodes_trained}, epsilon={self.epsilon:.2f})...")
+        history = []
+        q_changes = []  # per episode: sum of |Q-value change| / max|Q|
         for ep in range(episodes):
+            q_before = self.q_table.copy()
             state_vals = env.reset()
-            t_idx, h_idx = self.get_state(state_vals[0], state_vals[1])
+            if mode == 'fuzzy':
+                weights = self.get_fuzzy_state(state_vals[0], state_vals[1])
+            else:
+                t_idx, h_idx = self.get_state(state_vals[0], state_vals[1])
             
             for _ in range(50): # Steps per episode
-                fan_idx, mist_idx = self.choose_action(t_idx, h_idx)
+                if mode == 'fuzzy':
+                    fan_idx, mist_idx = self.choose_action_fuzzy(weights)
+                else:
+                    fan_idx, mist_idx = self.choose_action(t_idx, h_idx)
                 
                 # Convert action indices to control values (for environment)
                 # Low=20, Medium=50, High=80 approx
@@ -94,36 +219,88 @@ class FuzzyRLAgent:
                 mist_pwm = [20, 50, 80][mist_idx]
                 
                 next_vals, reward, _, _ = env.step(fan_pwm, mist_pwm)
-                nt_idx, nh_idx = self.get_state(next_vals[0], next_vals[1])
-                
-                self.update((t_idx, h_idx), (fan_idx, mist_idx), reward, (nt_idx, nh_idx))
-                
-                t_idx, h_idx = nt_idx, nh_idx
+                if mode == 'fuzzy':
+                    next_weights = self.get_fuzzy_state(next_vals[0], next_vals[1])
+                    self.fuzzy_update(weights, (fan_idx, mist_idx), reward, next_weights)
+                    weights = next_weights
+                else:
+                    nt_idx, nh_idx = self.get_state(next_vals[0], next_vals[1])
+                    self.update((t_idx, h_idx), (fan_idx, mist_idx), reward, (nt_idx, nh_idx))
+                    t_idx, h_idx = nt_idx, nh_idx
             
             if self.epsilon > self.epsilon_min:
                 self.epsilon *= self.epsilon_decay
+            self.episodes_trained += 1
+            q_changes.append(np.abs(self.q_table - q_before).sum() / max(np.abs(self.q_table).max(), 1e-9))
+
+            if eval_every and (ep + 1) % eval_every == 0:
+                history.append((ep + 1, self.evaluate(env, mode, episodes=eval_episodes)))
                 
-            if (ep+1) % 100 == 0:
-                print(f"Episode {ep+1}: Epsilon={self.epsilon:.2f}")
-        
-        self.save_q_table()
-        print("Training complete. Q-Table saved.")
+            if self.episodes_trained % 100 == 0:
+                print(f"Episode {self.episodes_trained}: Epsilon={self.epsilon:.2f}")
 
-    def evolve_rules(self):
-        """Generates a new rule set for the Sugeno controller based on the learned Q-Table."""
-        new_rules = []
-        print("Evolving rules based on learned policy...")
+            if save and checkpoint_every and self.episodes_trained % checkpoint_every == 0:
+                self.save_q_table()
+
+            if early_stop and len(history) >= stop_window and history[-1][0] == ep + 1:
+                recent = np.array([r for _, r in history[-stop_window:]])
+                q_change = np.mean(q_changes[-stop_window * eval_every:])
+                if np.ptp(recent) <= stop_band * abs(recent.mean()):
+                    print(f"Early stopping after {ep + 1} episodes: greedy return {recent.mean():.2f} "
+                          f"steady over the last {stop_window * eval_every} episodes.")
+                    break
+                if q_change < q_change_tol:
+                    print(f"Early stopping after {ep + 1} episodes: Q-values moved {q_change:.3f} x max|Q| "
+                          f"per episode over the last {stop_window * eval_every} episodes.")
+                    break
         
+        if history:
+            print(f"Greedy policy return: {history[-1][1]:.2f} per step.")
+
+        if save and self.q_table_file is not None:
+            self.save_q_table()
+            print("Training complete. Q-Table saved.")
+        return history
+
+    def reset_q_table(self):
+        """Fresh Q-table with default exploration and hyperparameters."""
+        self.q_table = np.zeros((5, 5, 3, 3))
+        self.alpha = 0.1  # Learning Rate
+        self.gamma = 0.9  # Discount Factor
+        self.epsilon = 1.0 # Exploration Rate
+        self.epsilon_decay = 0.995
+        self.epsilon_min = 0.01
+        self.episodes_trained = 0
+        self.mode = None  # 'tabular' or 'fuzzy' once trained
+
+    def policy_table(self):
+        """Returns the greedy policy as (temp_label, hum_label, fan_label, mist_label) entries."""
+        table = []
         for t_idx, t_label in enumerate(self.temp_labels):
             for h_idx, h_label in enumerate(self.hum_labels):
                 # Find best action for this fuzzy state
                 best_action_flat = np.argmax(self.q_table[t_idx, h_idx])
                 fan_idx = best_action_flat // 3
                 mist_idx = best_action_flat % 3
-                
-                fan_label = self.output_labels[fan_idx]
-                mist_label = self.output_labels[mist_idx]
-                
+                table.append((t_label, h_label, self.output_labels[fan_idx], self.output_labels[mist_idx]))
+        return table
+
+    def evolve_rules(self, prune=False):
+        """Generates a new rule set for the Sugeno controller based on the learned Q-Table.
+
+        With prune=True the 5x5 grid is passed through RuleAnalyzer, which drops
+        rules that never fire and merges neighbours sharing the same consequents.
+        """
+        new_rules = []
+        print("Evolving rules based on learned policy...")
+
+        if prune:
+            analyzer = RuleAnalyzer(self.controller)
+            new_rules, report = analyzer.prune(self.policy_table())
+            print(f"Rule base pruned: {report['original']} -> {report['pruned']} rules "
+                  f"({report['dead']} dead, max surface error {report['max_error']:.3f})")
+        else:
+            for t_label, h_label, fan_label, mist_label in self.policy_table():
                 # Create Rule: IF temp IS t_label AND hum IS h_label THEN fan IS fan_label, mist IS mist_label
                 # Note: skfuzzy ControlSystem usually takes 1 consequent per rule or multiple ANDed.
                 # It's cleaner to create separate rules or compound consequents.
@@ -139,5 +316,58 @@ class FuzzyRLAgent:
         self.controller.update_rules(new_rules)
         print("Fuzzy Rules Evolved!")
 
+def episodes_to_settle(history, tol=0.1, smooth=5):
+    """
+    First episode from which the greedy return (rolling median of `smooth` evaluations)
+    stays within tol * |final| of its final value. Returns (episode, final return), or
+    (None, None) if nothing was evaluated (episodes < eval_every or eval_every=0).
+    """
+    if not history:
+        return None, None
+    returns = [r for _, r in history]
+    medians = [np.median(returns[max(0, i + 1 - smooth):i + 1]) for i in range(len(returns))]
+    final = medians[-1]
+    settled = len(history) - 1
+    while settled > 0 and abs(medians[settled - 1] - final) <= tol * abs(final):
+        settled -= 1
+    return history[settled][0], float(final)
+
+def compare_training_modes(episodes=1000, seed=0, eval_every=25, tol=0.1):
+    """
+    Trains tabular and fuzzy Q-learning from scratch for the same number of episodes and
+    compares them on the same measure: the greedy-policy return (evaluate(), identical
+    start states for both modes) and the episode from which its rolling median stays
+    within tol of its final value. The last raw evaluation is reported next to the
+    median, so a policy that is still swinging is not shown as settled.
+    """
+    import time
+    from rl_env import GreenhouseEnv
+    from sugeno_controller import SugenoController
+
+    results = {}
+    for mode in ['tabular', 'fuzzy']:
+        np.random.seed(seed)
+        # No checkpoint: a q_table.pkl in the working directory must not leak in
+        agent = FuzzyRLAgent(SugenoController(), q_table_file=None)
+        start = time.perf_counter()
+        history = agent.train(GreenhouseEnv(), episodes=episodes, mode=mode, save=False,
+                              early_stop=False, eval_every=eval_every)
+        settled_at, final = episodes_to_settle(history, tol)
+        results[mode] = {'settled_at': settled_at, 'final_return': final,
+                         'last_return': history[-1][1] if history else None, 'history': history,
+                         'seconds': time.perf_counter() - start}
+
+    print(f"\nGreedy-policy return (mean reward per step, higher is better) after {episodes} episodes:")
+    for mode, r in results.items():
+        if r['final_return'] is None:
+            print(f"  {mode:8s}: not evaluated (eval_every={eval_every}, {episodes} episodes) ({r['seconds']:.1f} s wall-clock)")
+            continue
+        line = (f"  {mode:8s}: last {r['last_return']:6.2f}, median {r['final_return']:6.2f}, median within "
+                f"{100 * tol:.0f}% from episode {r['settled_at']} ({r['seconds']:.1f} s wall-clock)")
+        if abs(r['last_return'] - r['final_return']) > tol * abs(r['final_return']):
+            line += " - last evaluation off the median, policy not settled"
+        print(line)
+    return results
+
 # Helper needed for skfuzzy interp_membership
 import skfuzzy as fuzz
@@ -0,0 +1,210 @@
+from functools import lru_cache
+import numpy as np
+import skfuzzy as fuzz
+from skfuzzy import control as ctrl
+from simulation_pool import SimulationPool
+
+# Single declarative description of every fuzzy system in the project.
+# Universes are (start, stop, step) for np.arange; terms are (mf, breakpoints).
+FUZZY_SPEC = {
+    "universes": {
+        "temperature": (0, 51, 1),
+        "humidity": (0, 101, 1),
+        "fan": (0, 101, 1),
+        "mist": (0, 101, 1),
+    },
+    # Input terms are shared by all systems
+    "inputs": {
+        "temperature": {
+            "very_cold": ("trapmf", [0, 0, 5, 10]),
+            "cold": ("trimf", [5, 10, 20]),
+            "normal": ("trimf", [15, 25, 35]),
+            "warm": ("trimf", [30, 35, 40]),
+            "hot": ("trapmf", [35, 40, 50, 50]),
+        },
+        "humidity": {
+            "very_dry": ("trapmf", [0, 0, 10, 20]),
+            "dry": ("trimf", [10, 30, 50]),
+            "normal": ("trimf", [40, 55, 70]),
+            "humid": ("trimf", [60, 75, 90]),
+            "very_humid": ("trapmf", [80, 90, 100, 100]),
+        },
+    },
+    "systems": {
+        # Simple subset used by fuzzy_controller.run_fuzzy
+        "basic": {
+            "outputs": {
+                "fan": {
+                    "low": ("trimf", [0, 20, 40]),
+                    "medium": ("trimf", [30, 50, 70]),
+                    "high": ("trimf", [60, 80, 100]),
+                },
+                "mist": {
+                    "low": ("trimf", [0, 20, 40]),
+                    "medium": ("trimf", [30, 50, 70]),
+                    "high": ("trimf", [60, 80, 100]),
+                },
+            },
+            "rules": [
+                "IF temperature IS hot THEN fan IS high",
+                "IF temperature IS normal THEN fan IS medium",
+                "IF temperature IS cold THEN fan IS low",
+                "IF humidity IS very_dry THEN mist IS high",
+                "IF humidity IS normal THEN mist IS medium",
+                "IF humidity IS very_humid THEN mist IS low",
+            ],
+        },
+        "mamdani": {
+            "outputs": {
+                "fan": {
+                    "low": ("trimf", [0, 0, 40]),  # Adjusted for 0 start
+                    "medium": ("trimf", [30, 50, 70]),
+                    "high": ("trimf", [60, 100, 100]),
+                },
+                "mist": {
+                    "low": ("trimf", [0, 0, 40]),
+                    "medium": ("trimf", [30, 50, 70]),
+                    "high": ("trimf", [60, 100, 100]),
+                },
+            },
+            "rules": [
+                "IF temperature IS hot THEN fan IS high",
+                "IF temperature IS warm THEN fan IS medium",
+                "IF temperature IS normal THEN fan IS low",  # Maintain circulation even if normal
+                "IF temperature IS cold THEN fan IS low",
+                "IF temperature IS very_cold THEN fan IS low",
+                "IF humidity IS very_dry THEN mist IS high",
+                "IF humidity IS dry THEN mist IS medium",
+                "IF humidity IS normal THEN mist IS low",
+                "IF humidity IS humid THEN mist IS low",
+                "IF humidity IS very_humid THEN mist IS low",
+            ],
+        },
+        "sugeno": {
+            # Constant Outputs (Singletons approximation): Low: 20, Medium: 50, High: 80
+            "outputs": {
+                "fan": {
+                    "low": ("trimf", [19, 20, 21]),
+                    "medium": ("trimf", [49, 50, 51]),
+                    "high": ("trimf", [79, 80, 81]),
+                },
+                "mist": {
+                    "low": ("trimf", [19, 20, 21]),
+                    "medium": ("trimf", [49, 50, 51]),
+                    "high": ("trimf", [79, 80, 81]),
+                },
+            },
+            "rules": [
+                "IF temperature IS hot THEN fan IS high",
+                "IF temperature IS warm THEN fan IS medium",
+                "IF temperature IS normal THEN fan IS low",
+                "IF temperature IS cold THEN fan IS low",
+                "IF humidity IS very_dry THEN mist IS high",
+                "IF humidity IS dry THEN mist IS medium",
+                "IF humidity IS normal THEN mist IS low",
+                "IF humidity IS humid THEN mist IS low",
+                "IF humidity IS very_humid THEN mist IS low",
+            ],
+        },
+    },
+}
+
+MF_FUNCTIONS = {
+    "trimf": fuzz.trimf,
+    "trapmf": fuzz.trapmf,
+}
+
+
+def _readonly(arr):
+    arr.flags.writeable = False
+    return arr
+
+
+@lru_cache(maxsize=None)
+def compiled_arrays():
+    """
+    Universes and membership arrays for every variable/term in FUZZY_SPEC,
+    computed once per process and marked read-only so they can be shared.
+    Keys are variable names and (system, variable, term); inputs use system None.
+    """
+    universes = {name: _readonly(np.arange(*rng)) for name, rng in FUZZY_SPEC["universes"].items()}
+    mfs = {}
+    for var, terms in FUZZY_SPEC["inputs"].items():
+        for term, (kind, params) in terms.items():
+            mfs[(None, var, term)] = _readonly(MF_FUNCTIONS[kind](universes[var], params))
+    for system, spec in FUZZY_SPEC["systems"].items():
+        for var, terms in spec["outputs"].items():
+            for term, (kind, params) in terms.items():
+                mfs[(system, var, term)] = _readonly(MF_FUNCTIONS[kind](universes[var], params))
+    return universes, mfs
+
+
+def parse_rule(text, variables):
+    """
+    Parses 'IF <var> IS <term> [AND|OR <var> IS <term>]... THEN <var> IS <term> [AND ...]'
+    into an skfuzzy Rule. Antecedent connectives are applied left to right.
+    """
+    words = text.split()
+    if words[0] != "IF" or "THEN" not in words:
+        raise ValueError(f"Malformed rule: {text}")
+    then = words.index("THEN")
+
+    def clauses(tokens):
+        # Returns [(connective, var, term), ...] for 'var IS term (AND|OR var IS term)*'
+        out = []
+        connective = None
+        i = 0
+        while i < len(tokens):
+            if i + 2 >= len(tokens) or tokens[i + 1] != "IS":
+                raise ValueError(f"Malformed clause in rule: {text}")
+            out.append((connective, tokens[i], tokens[i + 2]))
+            if i + 3 < len(tokens):
+                connective = tokens[i + 3]
+                if connective not in ("AND", "OR"):
+                    raise ValueError(f"Unknown connective '{connective}' in rule: {text}")
+            i += 4
+        return out
+
+    antecedent = None
+    for connective, var, term in clauses(words[1:then]):
+        fuzzy_term = variables[var][term]
+        if antecedent is None:
+            antecedent = fuzzy_term
+        elif connective == "AND":
+            antecedent = antecedent & fuzzy_term
+        else:
+            antecedent = antecedent | fuzzy_term
+
+    consequents = [variables[var][term] for _, var, term in clauses(words[then + 1:])]
+    return ctrl.Rule(antecedent, consequents[0] if len(consequents) == 1 else tuple(consequents))
+
+
+class CompiledSystem:
+    """Variables, rules, ControlSystem and simulation pool for one system in FUZZY_SPEC."""
+
+    def __init__(self, name):
+        universes, mfs = compiled_arrays()
+        spec = FUZZY_SPEC["systems"][name]
+        self.name = name
+
+        # Fuzzy variables are thin wrappers; their arrays are the shared read-only ones
+        self.variables = {}
+        for var, terms in FUZZY_SPEC["inputs"].items():
+            self.variables[var] = ctrl.Antecedent(universes[var], var)
+            for term in terms:
+                self.variables[var][term] = mfs[(None, var, term)]
+        for var, terms in spec["outputs"].items():
+            self.variables[var] = ctrl.Consequent(universes[var], var)
+            for term in terms:
+                self.variables[var][term] = mfs[(name, var, term)]
+
+        self.rules = tuple(parse_rule(text, self.variables) for text in spec["rules"])
+        self.system = ctrl.ControlSystem(list(self.rules))
+        # Pooled simulations run on private copies, so one pool serves every controller view
+        self.pool = SimulationPool(self.system)
+
+
+@lru_cache(maxsize=None)
+def compile_system(name):
+    """Compiles a system from FUZZY_SPEC once per process; later calls return the same object."""
+    return CompiledSystem(name)
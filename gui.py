@@ -1,24 +1,13 @@
+import queue
+import threading
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from mamdani_controller import MamdaniController
 from sugeno_controller import SugenoController
-from plots import PlotManager
-
-# Plant Optimal Conditions Database
-PLANT_DATA = {
-    "cucumber": {
-        "Vegetative": {"temp": 25.0, "hum": 75.0},
-        "Flowering": {"temp": 24.0, "hum": 70.0},
-        "Fruiting": {"temp": 26.0, "hum": 80.0}
-    },
-    "tomato": {
-        "Vegetative": {"temp": 22.0, "hum": 65.0},
-        "Flowering": {"temp": 23.0, "hum": 60.0},
-        "Fruiting": {"temp": 24.0, "hum": 70.0}
-    }
-}
+from plots import PlotManager, SurfacePlotManager, iter_progressive_surfaces
+from plant_data import PLANT_DATA
 
 class GreenhouseControlGUI:
     def __init__(self, root):
@@ -45,6 +34,10 @@ class GreenhouseControlGUI:
         
         self.controller_type_var = tk.StringVar(value="Mamdani")
 
+        # Background surface computation
+        self.surface_cancel = None
+        self.surface_queue = queue.Queue()
+
         # Layout
         self.setup_ui()
         
@@ -146,16 +139,31 @@ class GreenhouseControlGUI:
 
         # --- Right Panel Content ---
         tk.Label(right_panel, text="Visualization", font=("Arial", 12, "bold"), bg="white").pack(anchor="w", padx=10, pady=5)
+
+        self.notebook = ttk.Notebook(right_panel)
+        self.notebook.pack(fill=tk.BOTH, expand=True)
+        sim_tab = tk.Frame(self.notebook, bg="white")
+        self.surface_tab = tk.Frame(self.notebook, bg="white")
+        self.notebook.add(sim_tab, text="Simulation")
+        self.notebook.add(self.surface_tab, text="Control Surfaces")
         
-        self.title_label = tk.Label(right_panel, text="Simulation", font=("Arial", 14, "bold"), bg="white")
+        self.title_label = tk.Label(sim_tab, text="Simulation", font=("Arial", 14, "bold"), bg="white")
         self.title_label.pack(pady=5)
 
         # Initial Plot
         self.fig = plt.Figure(figsize=(8, 6), dpi=100)
         self.plot_manager = PlotManager(self.fig)
-        self.canvas = FigureCanvasTkAgg(self.fig, master=right_panel)
+        self.canvas = FigureCanvasTkAgg(self.fig, master=sim_tab)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
 
+        # Surface Plots (filled in progressively by a background worker)
+        self.surface_status = tk.Label(self.surface_tab, text="Press 'Show Surfaces' to compute", font=("Arial", 10), bg="white")
+        self.surface_status.pack(pady=5)
+        self.surface_fig = plt.Figure(figsize=(8, 6), dpi=100)
+        self.surface_manager = SurfacePlotManager(self.surface_fig)
+        self.surface_canvas = FigureCanvasTkAgg(self.surface_fig, master=self.surface_tab)
+        self.surface_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
         # Initialize
         self.update_optimal_display()
         self.run_simulation()
@@ -169,6 +177,16 @@ class GreenhouseControlGUI:
         self.controller_name = mode
         self.run_simulation()
 
+        # Surfaces of the previous controller are stale now
+        if self.surface_cancel is not None:
+            self.surface_cancel.set()
+            self.surface_cancel = None
+            if self.notebook.select() == str(self.surface_tab):
+                self.show_surfaces()
+            else:
+                self.surface_manager.clear()
+                self.surface_status.config(text="Press 'Show Surfaces' to compute")
+
     def update_optimal_display(self, event=None):
         species = self.species_var.get()
         stage = self.stage_var.get()
@@ -211,8 +229,54 @@ class GreenhouseControlGUI:
             print(f"Error computing fuzzy logic: {e}")
 
     def show_surfaces(self):
-        messagebox.showinfo("Info", "3D Surface viewing is not embedded in this window. (Placeholder for pop-up)")
-        # In a real app we would launch plt.show() with the surface
+        self.notebook.select(self.surface_tab)
+
+        # Cancel any surface job that is still refining
+        if self.surface_cancel is not None:
+            self.surface_cancel.set()
+        cancel = threading.Event()
+        self.surface_cancel = cancel
+
+        controller = self.current_controller
+        name = self.controller_name
+        self.surface_status.config(text=f"{name} Controller - computing coarse surface...")
+
+        def worker():
+            # Runs off the Tk thread; results are handed over through the queue
+            for X, Y, Z_fan, Z_mist in iter_progressive_surfaces(controller, cancel_event=cancel):
+                self.surface_queue.put((cancel, name, X, Y, Z_fan, Z_mist))
+            self.surface_queue.put((cancel, name, None, None, None, None))
+
+        threading.Thread(target=worker, daemon=True).start()
+        self.root.after(50, self.poll_surfaces, cancel)
+
+    def poll_surfaces(self, job):
+        if job is not self.surface_cancel:
+            return  # A newer job has its own poller
+        latest = None
+        done = False
+        while True:
+            try:
+                cancel, name, X, Y, Z_fan, Z_mist = self.surface_queue.get_nowait()
+            except queue.Empty:
+                break
+            if cancel is not job or cancel.is_set():
+                continue  # Result from a cancelled job
+            if X is None:
+                done = True
+            else:
+                latest = (name, X, Y, Z_fan, Z_mist)
+
+        if latest is not None:
+            name, X, Y, Z_fan, Z_mist = latest
+            self.surface_manager.update_surfaces(X, Y, Z_fan, Z_mist)
+            state = "refining..." if not done else "done"
+            self.surface_status.config(text=f"{name} Controller - {X.shape[1]}x{X.shape[0]} grid ({state})")
+        elif done:
+            self.surface_status.config(text=self.surface_status.cget("text").replace("refining...", "done"))
+
+        if not done and not job.is_set():
+            self.root.after(100, self.poll_surfaces, job)
 
     def reset_simulation(self):
         self.temp_var.set(25.0)
@@ -0,0 +1,36 @@
+import numpy as np
+import gymnasium as gym
+from gymnasium import spaces
+from rl_env import GreenhouseEnv
+
+class GreenhouseGymEnv(gym.Env):
+    """
+    Gymnasium wrapper around GreenhouseEnv for stable-baselines3.
+
+    Observation: [temperature, humidity]. Action: [fan, mist] in 0-100.
+    GreenhouseEnv is a continuous task, so episodes are truncated after max_steps.
+    """
+
+    def __init__(self, max_steps=200, **env_kwargs):
+        super().__init__()
+        self.env = GreenhouseEnv(**env_kwargs)
+        self.max_steps = max_steps
+        self.steps = 0
+        self.observation_space = spaces.Box(low=np.array([0.0, 0.0], dtype=np.float32),
+                                            high=np.array([50.0, 100.0], dtype=np.float32))
+        self.action_space = spaces.Box(low=0.0, high=100.0, shape=(2,), dtype=np.float32)
+
+    def reset(self, seed=None, options=None):
+        super().reset(seed=seed)
+        if seed is not None:
+            # GreenhouseEnv draws from numpy's global generator
+            np.random.seed(seed)
+        self.steps = 0
+        return self.env.reset().astype(np.float32), {}
+
+    def step(self, action):
+        fan, mist = np.clip(action, 0.0, 100.0)
+        state, reward, done, info = self.env.step(float(fan), float(mist))
+        self.steps += 1
+        truncated = self.steps >= self.max_steps
+        return state.astype(np.float32), float(reward), done, truncated, info
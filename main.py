@@ -3,7 +3,7 @@ import tkinter as tk
 from gui import GreenhouseControlGUI
 from simulation import run_full_simulation
 from adaptive_logic import AdaptiveLogic
-from fuzzy_rl import FuzzyRLAgent
+from fuzzy_rl import FuzzyRLAgent, compare_training_modes
 from rl_env import GreenhouseEnv
 from sugeno_controller import SugenoController
 from mamdani_controller import MamdaniController
@@ -17,6 +17,7 @@ def print_menu():
     print("3. Analyze Mamdani Controller")
     print("4. Analyze Sugeno Controller")
     print("5. Train RL Agent & Evolve Rules")
+    print("6. Compare Tabular vs Fuzzy Q-Learning")
     print("7. Test Adaptive Parameters")
     print("8. Launch GUI")
     print("9. Exit")
@@ -53,11 +54,24 @@ def main():
              episodes = input("Enter number of episodes (default 200): ")
              if not episodes.isdigit(): episodes = 200
              else: episodes = int(episodes)
+
+             mode = input("Learning mode - tabular/fuzzy (default tabular): ").strip().lower()
+             if mode not in ('tabular', 'fuzzy'): mode = 'tabular'
+             if agent.mode is not None and agent.mode != mode:
+                 restart = input(f"Saved Q-table was trained in {agent.mode} mode. Start over in {mode} mode? (y/N): ")
+                 if restart.strip().lower() == 'y':
+                     agent.reset_q_table()
+                 else:
+                     mode = agent.mode
+                     print(f"Continuing in {mode} mode.")
              
-             agent.train(env, episodes=episodes)
-             agent.evolve_rules()
+             agent.train(env, episodes=episodes, mode=mode)
+             agent.evolve_rules(prune=True)
              
              print("Rules updated in memory. Launch GUI to test new rules.")
+        elif choice == '6':
+             print("Comparing Q-Learning modes (Q-table file is not modified)...")
+             compare_training_modes()
         elif choice == '7':
              print("Testing Adaptive Parameters...")
              adaptive.adjust_parameters("High Humidity detected")
@@ -0,0 +1,122 @@
+import time
+import numpy as np
+from rl_env import GreenhouseEnv, greenhouse_derivatives
+from plant_data import PLANT_DATA
+
+class MPCController:
+    """
+    Model-predictive controller using the GreenhouseEnv dynamics for lookahead.
+
+    Candidate fan/mist sequences (a first action held for `switch_step` steps, then a
+    second action held for the rest of the horizon) are rolled out together as numpy
+    arrays, scored against the PLANT_DATA setpoint with the same error weighting as the
+    environment reward, and the first action of the best sequence is returned.
+    """
+
+    def __init__(self, species="cucumber", stage="Vegetative", horizon=8, switch_step=3,
+                 levels=(0, 25, 50, 75, 100), effort_weight=0.01, time_budget=0.005,
+                 batch_size=256, ext_temp=35.0, ext_hum=40.0):
+        self.horizon = horizon
+        self.effort_weight = effort_weight
+        self.time_budget = time_budget  # seconds per compute() call
+        self.ext_temp = ext_temp
+        self.ext_hum = ext_hum
+        self.set_target(species, stage)
+
+        # Single-step action grid: every (fan, mist) level pair
+        fan_levels, mist_levels = np.meshgrid(levels, levels, indexing='ij')
+        actions = np.stack([fan_levels.ravel(), mist_levels.ravel()], axis=1).astype(float)
+        n = len(actions)
+
+        # Candidate sequences, ordered so constant sequences (a0 == a1) come first:
+        # if the time budget cuts evaluation short, every first action was still tried.
+        first, second = np.meshgrid(np.arange(n), np.arange(n), indexing='ij')
+        first, second = first.ravel(), second.ravel()
+        order = np.argsort(first != second, kind='stable')
+        first, second = first[order], second[order]
+
+        steps = np.arange(horizon)
+        seq = np.where(steps[None, :] < switch_step, first[:, None], second[:, None])
+        self.fan_seq = actions[seq, 0]   # (n_candidates, horizon)
+        self.mist_seq = actions[seq, 1]
+        self.batch_size = batch_size  # candidates rolled out per vectorized batch
+
+        self.evaluated = 0  # candidates scored in the last compute()
+
+    def set_target(self, species, stage):
+        data = PLANT_DATA[species][stage]
+        self.opt_temp = data["temp"]
+        self.opt_hum = data["hum"]
+
+    def rollout_cost(self, temp, hum, fan_seq, mist_seq):
+        """Vectorized horizon rollout; returns the cost of every candidate sequence."""
+        temp = np.full(len(fan_seq), float(temp))
+        hum = np.full(len(fan_seq), float(hum))
+        cost = np.zeros(len(fan_seq))
+        for k in range(fan_seq.shape[1]):
+            dt_dt, dh_dt = greenhouse_derivatives(temp, hum, fan_seq[:, k], mist_seq[:, k],
+                                                  self.ext_temp, self.ext_hum)
+            temp = np.clip(temp + dt_dt, 0, 50)
+            hum = np.clip(hum + dh_dt, 0, 100)
+            cost += np.abs(temp - self.opt_temp) + 0.5 * np.abs(hum - self.opt_hum)
+            cost += self.effort_weight * (fan_seq[:, k] + mist_seq[:, k])
+        return cost
+
+    def compute(self, temp_input, hum_input):
+        start = time.perf_counter()
+        best_cost = np.inf
+        best_idx = 0
+        self.evaluated = 0
+        for lo in range(0, len(self.fan_seq), self.batch_size):
+            hi = min(lo + self.batch_size, len(self.fan_seq))
+            cost = self.rollout_cost(temp_input, hum_input, self.fan_seq[lo:hi], self.mist_seq[lo:hi])
+            idx = int(np.argmin(cost))
+            if cost[idx] < best_cost:
+                best_cost = cost[idx]
+                best_idx = lo + idx
+            self.evaluated = hi
+            if time.perf_counter() - start > self.time_budget:
+                break
+        return self.fan_seq[best_idx, 0], self.mist_seq[best_idx, 0]
+
+
+def benchmark_controllers(species="cucumber", stage="Vegetative", episodes=5, steps=100, seed=0):
+    """Closed-loop comparison of Mamdani, Sugeno and MPC on GreenhouseEnv."""
+    from mamdani_controller import MamdaniController
+    from sugeno_controller import SugenoController
+
+    controllers = {
+        "Mamdani": MamdaniController(),
+        "Sugeno": SugenoController(),
+        "MPC": MPCController(species, stage),
+    }
+    target = PLANT_DATA[species][stage]
+    results = {}
+    for name, controller in controllers.items():
+        np.random.seed(seed)
+        env = GreenhouseEnv()
+        env.optimal_temp = target["temp"]
+        env.optimal_hum = target["hum"]
+        errors_t, errors_h, timings = [], [], []
+        for _ in range(episodes):
+            temp, hum = env.reset()
+            for _ in range(steps):
+                start = time.perf_counter()
+                fan, mist = controller.compute(temp, hum)
+                timings.append(time.perf_counter() - start)
+                (temp, hum), _, _, _ = env.step(fan, mist)
+                errors_t.append(abs(temp - env.optimal_temp))
+                errors_h.append(abs(hum - env.optimal_hum))
+        results[name] = {
+            'mean_temp_error': float(np.mean(errors_t)),
+            'mean_hum_error': float(np.mean(errors_h)),
+            'mean_compute_ms': 1000 * float(np.mean(timings)),
+        }
+        r = results[name]
+        print(f"{name:8s} temp err {r['mean_temp_error']:6.2f} °C | hum err {r['mean_hum_error']:6.2f} % | "
+              f"{r['mean_compute_ms']:7.3f} ms/compute")
+    return results
+
+
+if __name__ == "__main__":
+    benchmark_controllers()
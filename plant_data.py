@@ -0,0 +1,13 @@
+# Plant Optimal Conditions Database
+PLANT_DATA = {
+    "cucumber": {
+        "Vegetative": {"temp": 25.0, "hum": 75.0},
+        "Flowering": {"temp": 24.0, "hum": 70.0},
+        "Fruiting": {"temp": 26.0, "hum": 80.0}
+    },
+    "tomato": {
+        "Vegetative": {"temp": 22.0, "hum": 65.0},
+        "Flowering": {"temp": 23.0, "hum": 60.0},
+        "Fruiting": {"temp": 24.0, "hum": 70.0}
+    }
+}
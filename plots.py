@@ -84,6 +84,76 @@ class PlotManager:
         self.fig.canvas.draw()
 
 
+class SurfacePlotManager:
+    """Draws Fan / Mist control surfaces and contours onto an embedded figure."""
+
+    def __init__(self, fig):
+        self.fig = fig
+        self.axes = [
+            self.fig.add_subplot(2, 2, 1, projection='3d'),
+            self.fig.add_subplot(2, 2, 2),
+            self.fig.add_subplot(2, 2, 3, projection='3d'),
+            self.fig.add_subplot(2, 2, 4),
+        ]
+        self.fig.subplots_adjust(hspace=0.45, wspace=0.3)
+        self.colorbars = []
+
+    def clear(self):
+        """Removes all plotted surfaces, e.g. when they belong to another controller."""
+        for cb in self.colorbars:
+            cb.remove()
+        self.colorbars = []
+        for ax in self.axes:
+            ax.clear()
+        self.fig.canvas.draw_idle()
+
+    def update_surfaces(self, X, Y, Z_fan, Z_mist):
+        self.clear()
+
+        panels = [(Z_fan, 'Fan Power (%)', self.axes[0], self.axes[1]),
+                  (Z_mist, 'Misting Intensity (%)', self.axes[2], self.axes[3])]
+        for Z, label, ax_3d, ax_contour in panels:
+            ax_3d.plot_surface(X, Y, Z, cmap='viridis', edgecolor='none', alpha=0.9)
+            ax_3d.set_title(f'3D Control Surface: {label}', fontsize=9, weight='bold')
+            ax_3d.set_xlabel('Temperature (°C)', fontsize=8)
+            ax_3d.set_ylabel('Humidity (%)', fontsize=8)
+            ax_3d.set_zlim(0, 100)
+
+            cont = ax_contour.contourf(X, Y, Z, cmap='viridis', levels=20)
+            ax_contour.set_title(f'Contour Plot: {label}', fontsize=9, weight='bold')
+            ax_contour.set_xlabel('Temperature (°C)', fontsize=8)
+            ax_contour.set_ylabel('Humidity (%)', fontsize=8)
+            self.colorbars.append(self.fig.colorbar(cont, ax=ax_contour))
+
+        self.fig.canvas.draw_idle()
+
+
+def iter_progressive_surfaces(controller, levels=(5, 9, 17, 33, 65), cancel_event=None):
+    """
+    Yields (X, Y, Z_fan, Z_mist) on successively finer uniform grids.
+    Grid sizes of the form 2^k + 1 are nested, so each level only evaluates the
+    points that the previous levels did not. Stops early once cancel_event is set.
+    """
+    finest = levels[-1]
+    samples = {}
+    for n in levels:
+        step = (finest - 1) // (n - 1)
+        x_range = np.linspace(0, 50, n)   # Temperature
+        y_range = np.linspace(0, 100, n)  # Humidity
+        X, Y = np.meshgrid(x_range, y_range)
+        Z_fan = np.zeros_like(X)
+        Z_mist = np.zeros_like(X)
+        for i in range(n):
+            if cancel_event is not None and cancel_event.is_set():
+                return
+            for j in range(n):
+                key = (i * step, j * step)
+                if key not in samples:
+                    samples[key] = controller.compute(X[i, j], Y[i, j])
+                Z_fan[i, j], Z_mist[i, j] = samples[key]
+        yield X, Y, Z_fan, Z_mist
+
+
 def plot_membership_functions(controller):
     """
     Plots all membership functions (Inputs and Outputs) in a single figure.
@@ -116,15 +186,14 @@ def plot_membership_functions(controller):
     plt.tight_layout(rect=[0, 0.03, 1, 0.95])
     plt.show()
 
-def plot_control_surfaces(controller):
+def compute_control_surfaces(controller, resolution=50):
     """
-    Plots 3D control surfaces and contour plots for Fan and Mist outputs.
+    Samples Fan and Mist outputs on a uniform resolution x resolution grid.
+    Returns X, Y, Z_fan, Z_mist.
     """
-    print("Calculating control surfaces... (High Resolution)")
-    
     # 1. Define range
-    x_range = np.linspace(0, 50, 50)   # Temperature
-    y_range = np.linspace(0, 100, 50)  # Humidity
+    x_range = np.linspace(0, 50, resolution)   # Temperature
+    y_range = np.linspace(0, 100, resolution)  # Humidity
     X, Y = np.meshgrid(x_range, y_range)
     
     Z_fan = np.zeros_like(X)
@@ -137,6 +206,99 @@ def plot_control_surfaces(controller):
             fan_val, mist_val = controller.compute(X[i, j], Y[i, j])
             Z_fan[i, j] = fan_val
             Z_mist[i, j] = mist_val
+
+    return X, Y, Z_fan, Z_mist
+
+def compute_control_surfaces_adaptive(controller, resolution=200, coarse=8, max_depth=5, tol=0.5):
+    """
+    Quadtree-refined control surfaces. Starts from a coarse x coarse grid of cells and
+    only subdivides cells whose edge midpoints / centre deviate from the bilinear
+    interpolation of their corners by more than tol (output %), so flat plateaus stay
+    coarse and MF transitions get resolved. The refined mesh is then resampled to a
+    regular resolution x resolution grid. Returns X, Y, Z_fan, Z_mist, n_calls.
+    """
+    # Samples live on a fine lattice; a cell of size s spans s lattice steps
+    n = coarse * 2 ** max_depth + 1
+    x_lattice = np.linspace(0, 50, n)   # Temperature
+    y_lattice = np.linspace(0, 100, n)  # Humidity
+    samples = {}
+
+    def evaluate(i, j):
+        if (i, j) not in samples:
+            samples[(i, j)] = controller.compute(x_lattice[j], y_lattice[i])
+        return np.asarray(samples[(i, j)], dtype=float)
+
+    size = 2 ** max_depth
+    cells = [(i, j, size) for i in range(0, n - 1, size) for j in range(0, n - 1, size)]
+    leaves = []
+    while cells:
+        i, j, s = cells.pop()
+        c00, c01 = evaluate(i, j), evaluate(i, j + s)
+        c10, c11 = evaluate(i + s, j), evaluate(i + s, j + s)
+        if s == 1:
+            leaves.append((i, j, s))
+            continue
+
+        h = s // 2
+        # Midpoints compared with what bilinear interpolation of the corners predicts
+        err = max(
+            np.max(np.abs(evaluate(i, j + h) - (c00 + c01) / 2)),
+            np.max(np.abs(evaluate(i + s, j + h) - (c10 + c11) / 2)),
+            np.max(np.abs(evaluate(i + h, j) - (c00 + c10) / 2)),
+            np.max(np.abs(evaluate(i + h, j + s) - (c01 + c11) / 2)),
+            np.max(np.abs(evaluate(i + h, j + h) - (c00 + c01 + c10 + c11) / 4)),
+        )
+        if err > tol:
+            cells.extend([(i, j, h), (i, j + h, h), (i + h, j, h), (i + h, j + h, h)])
+        else:
+            leaves.append((i, j, s))
+
+    # Fill every leaf bilinearly from its corners, then restore the exact samples
+    Z = np.zeros((2, n, n))
+    for i, j, s in leaves:
+        w = np.linspace(0, 1, s + 1)
+        c00, c01 = evaluate(i, j), evaluate(i, j + s)
+        c10, c11 = evaluate(i + s, j), evaluate(i + s, j + s)
+        for k in range(2):
+            top = c00[k] + (c01[k] - c00[k]) * w
+            bottom = c10[k] + (c11[k] - c10[k]) * w
+            Z[k, i:i + s + 1, j:j + s + 1] = top[None, :] + (bottom - top)[None, :] * w[:, None]
+    for (i, j), val in samples.items():
+        Z[:, i, j] = val
+
+    # Resample the lattice to the requested regular grid (separable linear interpolation)
+    x_range = np.linspace(0, 50, resolution)
+    y_range = np.linspace(0, 100, resolution)
+    X, Y = np.meshgrid(x_range, y_range)
+    out = []
+    for k in range(2):
+        rows = np.array([np.interp(x_range, x_lattice, row) for row in Z[k]])
+        out.append(np.array([np.interp(y_range, y_lattice, col) for col in rows.T]).T)
+
+    return X, Y, out[0], out[1], len(samples)
+
+def compare_surface_methods(controller, resolution=200, **kwargs):
+    """Reports controller calls and error of the adaptive surface against a uniform grid."""
+    _, _, ref_fan, ref_mist = compute_control_surfaces(controller, resolution)
+    _, _, Z_fan, Z_mist, n_calls = compute_control_surfaces_adaptive(controller, resolution, **kwargs)
+    err = np.maximum(np.abs(Z_fan - ref_fan), np.abs(Z_mist - ref_mist))
+    print(f"Uniform {resolution}x{resolution}: {resolution * resolution} calls")
+    print(f"Adaptive: {n_calls} calls ({100.0 * n_calls / resolution ** 2:.1f}%), "
+          f"max error {err.max():.2f}%, mean error {err.mean():.3f}%")
+    return n_calls, float(err.max()), float(err.mean())
+
+def plot_control_surfaces(controller, adaptive=False):
+    """
+    Plots 3D control surfaces and contour plots for Fan and Mist outputs.
+    With adaptive=True the surfaces come from compute_control_surfaces_adaptive.
+    """
+    if adaptive:
+        print("Calculating control surfaces... (Adaptive Mesh)")
+        X, Y, Z_fan, Z_mist, n_calls = compute_control_surfaces_adaptive(controller)
+        print(f"Adaptive mesh used {n_calls} controller evaluations")
+    else:
+        print("Calculating control surfaces... (High Resolution)")
+        X, Y, Z_fan, Z_mist = compute_control_surfaces(controller)
             
     # 3. Plot Fan Surface
     fig1 = plt.figure(figsize=(16, 6))
@@ -0,0 +1,128 @@
+import numpy as np
+
+# Activation functions supported by the exported MLP.
+# SB3's MlpPolicy uses Tanh by default for PPO.
+ACTIVATIONS = {
+    'tanh': np.tanh,
+    'relu': lambda x: np.maximum(x, 0.0),
+    'identity': lambda x: x,
+}
+
+
+def export_policy(model_path="fuzzy_rl_agent", out_path="fuzzy_rl_agent_policy.npz"):
+    """
+    Extracts the actor network of a saved stable-baselines3 PPO MlpPolicy
+    into a compact .npz file that NumpyPolicy can load without torch.
+    """
+    # Imported here so the inference side never pulls in torch / SB3
+    import torch.nn as nn
+    from stable_baselines3 import PPO
+
+    model = PPO.load(model_path, device="cpu")
+    policy = model.policy
+
+    arrays = {}
+    layers = [m for m in policy.mlp_extractor.policy_net if isinstance(m, nn.Linear)]
+    activation = 'identity'
+    for m in policy.mlp_extractor.policy_net:
+        if isinstance(m, nn.Tanh):
+            activation = 'tanh'
+        elif isinstance(m, nn.ReLU):
+            activation = 'relu'
+
+    # Hidden layers followed by the action head
+    layers.append(policy.action_net)
+    for i, layer in enumerate(layers):
+        arrays[f'w{i}'] = layer.weight.detach().cpu().numpy().astype(np.float32)
+        arrays[f'b{i}'] = layer.bias.detach().cpu().numpy().astype(np.float32)
+
+    space = model.action_space
+    if hasattr(space, 'n'):
+        arrays['action_kind'] = np.array('discrete')
+    else:
+        arrays['action_kind'] = np.array('box')
+        arrays['action_low'] = np.asarray(space.low, dtype=np.float32)
+        arrays['action_high'] = np.asarray(space.high, dtype=np.float32)
+        arrays['action_shape'] = np.asarray(space.shape, dtype=np.int64)
+    arrays['squash_output'] = np.array(bool(policy.squash_output))
+    arrays['activation'] = np.array(activation)
+    arrays['n_layers'] = np.array(len(layers))
+
+    np.savez(out_path, **arrays)
+    print(f"Exported policy ({len(layers)} layers, {activation}) to {out_path}")
+    return out_path
+
+
+class NumpyPolicy:
+    """Pure-NumPy deterministic forward pass of an exported PPO actor."""
+
+    def __init__(self, path="fuzzy_rl_agent_policy.npz"):
+        data = np.load(path)
+        n_layers = int(data['n_layers'])
+        self.weights = [data[f'w{i}'] for i in range(n_layers)]
+        self.biases = [data[f'b{i}'] for i in range(n_layers)]
+        self.activation = ACTIVATIONS[str(data['activation'])]
+        self.action_kind = str(data['action_kind'])
+        self.squash_output = bool(data['squash_output'])
+        if self.action_kind == 'box':
+            self.action_low = data['action_low']
+            self.action_high = data['action_high']
+            self.action_shape = tuple(data['action_shape'])
+
+    def forward(self, obs):
+        """Returns raw action-head outputs for a batch of observations."""
+        x = np.asarray(obs, dtype=np.float32).reshape(len(obs), -1)
+        for w, b in zip(self.weights[:-1], self.biases[:-1]):
+            x = self.activation(x @ w.T + b)
+        return x @ self.weights[-1].T + self.biases[-1]
+
+    def predict(self, obs):
+        """
+        Deterministic action for a single observation or a batch,
+        matching model.predict(obs, deterministic=True).
+        """
+        obs = np.asarray(obs, dtype=np.float32)
+        single = obs.ndim <= 1
+        batch = obs.reshape(1, -1) if single else obs
+        out = self.forward(batch)
+
+        if self.action_kind == 'discrete':
+            actions = np.argmax(out, axis=1)
+        else:
+            if self.squash_output:
+                # Gaussian mean is passed through tanh, then rescaled to bounds
+                out = np.tanh(out)
+                out = self.action_low + 0.5 * (out + 1.0) * (self.action_high - self.action_low)
+            else:
+                out = np.clip(out, self.action_low, self.action_high)
+            actions = out.reshape((len(batch),) + self.action_shape)
+
+        return actions[0] if single else actions
+
+
+def check_parity(model_path="fuzzy_rl_agent", npz_path="fuzzy_rl_agent_policy.npz",
+                 n_samples=1000, atol=1e-4):
+    """Compares NumpyPolicy against SB3's deterministic predict on random observations."""
+    from stable_baselines3 import PPO
+
+    model = PPO.load(model_path, device="cpu")
+    np_policy = NumpyPolicy(npz_path)
+
+    obs = np.stack([model.observation_space.sample() for _ in range(n_samples)]).astype(np.float32)
+    sb3_actions, _ = model.predict(obs, deterministic=True)
+    np_actions = np_policy.predict(obs)
+
+    if np_policy.action_kind == 'discrete':
+        mismatches = int(np.sum(sb3_actions != np_actions))
+        ok = mismatches == 0
+        print(f"Parity check: {mismatches}/{n_samples} mismatched actions")
+    else:
+        max_err = float(np.max(np.abs(sb3_actions - np_actions)))
+        ok = max_err <= atol
+        print(f"Parity check: max abs error {max_err:.2e} over {n_samples} samples")
+    return ok
+
+
+if __name__ == "__main__":
+    export_policy()
+    check_parity()
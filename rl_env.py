@@ -1,13 +1,39 @@
 import numpy as np
 
+# Rate of change constants
+K_T_EXT = 0.05   # Heat gain from outside
+K_H_EXT = 0.05   # Moisture loss/gain from outside
+
+K_FAN_T = 0.15   # Cooling effect of fan
+K_FAN_H = 0.1    # Humidity removal of fan
+
+K_MIST_T = 0.05  # Cooling effect of mist
+K_MIST_H = 0.2   # Humidification
+
+def greenhouse_derivatives(temp, hum, fan_power, mist_power, ext_temp=35.0, ext_hum=40.0):
+    """
+    Noise-free per-step change of temperature and humidity.
+    Works elementwise on scalars or numpy arrays (used for vectorized rollouts).
+    """
+    # Temp changes: Moves towards external + Fan cools + Mist cools
+    dt_dt = K_T_EXT * (ext_temp - temp) - K_FAN_T * (fan_power / 100.0 * 10) - K_MIST_T * (mist_power / 100.0 * 5)
+    
+    # Humidity changes: Moves towards external - Fan dries + Mist wets
+    dh_dt = K_H_EXT * (ext_hum - hum) - K_FAN_H * (fan_power / 100.0 * 10) + K_MIST_H * (mist_power / 100.0 * 20)
+    return dt_dt, dh_dt
+
 class GreenhouseEnv:
-    def __init__(self):
+    def __init__(self, ext_temp=35.0, ext_hum=40.0, optimal_temp=25.0, optimal_hum=70.0):
         # State: [Temperature, Humidity]
         self.state = np.array([25.0, 60.0]) # Initial optimal-ish
-        self.optimal_temp = 25.0
-        self.optimal_hum = 70.0 # for cucumber/vegetative
+        self.optimal_temp = optimal_temp
+        self.optimal_hum = optimal_hum # default for cucumber/vegetative
         self.dt = 1 # Simulation time step
 
+        # External Environment (defaults: Hot & Dry for contrast)
+        self.ext_temp = ext_temp
+        self.ext_hum = ext_hum
+
     def reset(self):
         # Random initialization
         t = np.random.uniform(10, 40)
@@ -23,26 +49,8 @@ class GreenhouseEnv:
         temp, hum = self.state
         
         # Physics approximation
-        # External Environment (Assumed Hot & Dry for contrast)
-        ext_temp = 35.0
-        ext_hum = 40.0
-        
-        # Rate of change constants
-        k_t_ext = 0.05  # Heat gain from outside
-        k_h_ext = 0.05  # Moisture loss/gain from outside
-        
-        k_fan_t = 0.15   # Cooling effect of fan
-        k_fan_h = 0.1   # Humidity removal of fan
-        
-        k_mist_t = 0.05  # Cooling effect of mist
-        k_mist_h = 0.2   # Humidification
-        
         # Calculate deltas
-        # Temp changes: Moves towards external + Fan cools + Mist cools
-        dt_dt = k_t_ext * (ext_temp - temp) - k_fan_t * (fan_power / 100.0 * 10) - k_mist_t * (mist_power / 100.0 * 5)
-        
-        # Humidity changes: Moves towards external - Fan dries + Mist wets
-        dh_dt = k_h_ext * (ext_hum - hum) - k_fan_h * (fan_power / 100.0 * 10) + k_mist_h * (mist_power / 100.0 * 20)
+        dt_dt, dh_dt = greenhouse_derivatives(temp, hum, fan_power, mist_power, self.ext_temp, self.ext_hum)
         
         # Update state with noise
         temp += dt_dt + np.random.normal(0, 0.1)
@@ -0,0 +1,131 @@
+from functools import reduce
+import numpy as np
+import skfuzzy as fuzz
+from skfuzzy import control as ctrl
+from simulation_pool import SimulationPool
+
+class RuleAnalyzer:
+    """
+    Analyzes a grid rule base (one rule per temperature/humidity term pair),
+    drops rules that never fire and merges adjacent rules with identical
+    consequents into OR-rules.
+
+    Rules are handled as entries of the form
+    (temp_labels, hum_labels, fan_label, mist_label), where the label tuples
+    are OR-ed together inside each input and AND-ed across inputs.
+    """
+
+    def __init__(self, controller, resolution=101):
+        self.controller = controller
+        self.temperature, self.humidity, self.fan, self.mist = controller.get_variables()
+        self.temp_labels = list(self.temperature.terms)
+        self.hum_labels = list(self.humidity.terms)
+
+        # Membership degree of every input term sampled over the input domain
+        self.temp_grid = np.linspace(self.temperature.universe.min(), self.temperature.universe.max(), resolution)
+        self.hum_grid = np.linspace(self.humidity.universe.min(), self.humidity.universe.max(), resolution)
+        self.temp_mu = {label: fuzz.interp_membership(self.temperature.universe, self.temperature[label].mf, self.temp_grid)
+                        for label in self.temp_labels}
+        self.hum_mu = {label: fuzz.interp_membership(self.humidity.universe, self.humidity[label].mf, self.hum_grid)
+                       for label in self.hum_labels}
+
+    def max_activation(self, entry):
+        """Maximum firing strength of a rule anywhere in the input domain."""
+        t_labels, h_labels = entry[0], entry[1]
+        t_mu = reduce(np.fmax, [self.temp_mu[label] for label in t_labels])
+        h_mu = reduce(np.fmax, [self.hum_mu[label] for label in h_labels])
+        # AND is min, so the firing strength over the grid is the outer min
+        return float(np.max(np.fmin.outer(t_mu, h_mu)))
+
+    def merge(self, entries):
+        """Merges adjacent antecedents sharing the same consequents into OR-rules."""
+        # 1. Merge neighbouring humidity terms within each temperature term
+        rows = []
+        for t_label in self.temp_labels:
+            row = sorted((e for e in entries if e[0] == (t_label,)),
+                         key=lambda e: self.hum_labels.index(e[1][0]))
+            rows.extend(self._merge_runs(row, axis=1, order=self.hum_labels))
+
+        # 2. Merge neighbouring temperature blocks with the same humidity span
+        merged = []
+        keys = []
+        for e in rows:
+            key = (e[1], e[2], e[3])
+            if key not in keys:
+                keys.append(key)
+        for key in keys:
+            column = sorted((e for e in rows if (e[1], e[2], e[3]) == key),
+                            key=lambda e: self.temp_labels.index(e[0][0]))
+            merged.extend(self._merge_runs(column, axis=0, order=self.temp_labels))
+        return merged
+
+    def _merge_runs(self, entries, axis, order):
+        runs = []
+        for e in entries:
+            if runs:
+                last = runs[-1]
+                same_other = last[1 - axis] == e[1 - axis]
+                same_out = last[2:] == e[2:]
+                adjacent = order.index(e[axis][0]) == order.index(last[axis][-1]) + 1
+                if same_other and same_out and adjacent:
+                    span = list(last)
+                    span[axis] = last[axis] + e[axis]
+                    runs[-1] = tuple(span)
+                    continue
+            runs.append(e)
+        return runs
+
+    def build_rules(self, entries):
+        """Converts rule entries into skfuzzy rules on the controller's variables."""
+        rules = []
+        for t_labels, h_labels, fan_label, mist_label in entries:
+            t_term = reduce(lambda a, b: a | b, [self.temperature[label] for label in t_labels])
+            h_term = reduce(lambda a, b: a | b, [self.humidity[label] for label in h_labels])
+            rules.append(ctrl.Rule(t_term & h_term, (self.fan[fan_label], self.mist[mist_label])))
+        return rules
+
+    def surface(self, rules, resolution=21):
+        """Evaluates fan/mist outputs of a rule set on a regular input grid."""
+        # Pooled simulations run on a private copy of the (shared) variables
+        pool = SimulationPool(ctrl.ControlSystem(rules))
+        x_range = np.linspace(self.temp_grid[0], self.temp_grid[-1], resolution)
+        y_range = np.linspace(self.hum_grid[0], self.hum_grid[-1], resolution)
+        Z = np.zeros((2, resolution, resolution))
+        for i, y in enumerate(y_range):
+            for j, x in enumerate(x_range):
+                try:
+                    outputs = pool.compute({'temperature': x, 'humidity': y})
+                    Z[0, i, j] = outputs['fan']
+                    Z[1, i, j] = outputs['mist']
+                except Exception:
+                    # Same fallback as the controllers when nothing fires
+                    Z[:, i, j] = 0.0
+        return Z
+
+    def prune(self, table, min_activation=0.05, tol=1.0):
+        """
+        Prunes and merges a (temp_label, hum_label, fan_label, mist_label) grid.
+        Returns (rules, report). If the pruned surface deviates from the full
+        one by more than tol (output %), the full rule set is returned instead.
+        """
+        entries = [((t,), (h,), f, m) for t, h, f, m in table]
+        alive = [e for e in entries if self.max_activation(e) >= min_activation]
+        merged = self.merge(alive)
+
+        full_rules = self.build_rules(entries)
+        pruned_rules = self.build_rules(merged)
+        max_error = float(np.max(np.abs(self.surface(full_rules) - self.surface(pruned_rules))))
+
+        report = {
+            'original': len(entries),
+            'dead': len(entries) - len(alive),
+            'pruned': len(merged),
+            'max_error': max_error,
+            'entries': merged,
+        }
+        if max_error > tol:
+            print(f"Pruned surface differs by {max_error:.3f} (> {tol}), keeping full rule set.")
+            report['pruned'] = len(entries)
+            report['entries'] = entries
+            return full_rules, report
+        return pruned_rules, report
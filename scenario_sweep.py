@@ -0,0 +1,181 @@
+"""
+Headless scenario sweep comparing controllers.
+
+Runs every combination of controller x external (temperature, humidity) condition x
+PLANT_DATA species/stage in parallel across cores and writes a CSV report plus a
+per-controller summary.
+
+    python scenario_sweep.py --workers 8 --output sweep_report.csv
+"""
+import argparse
+import csv
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from rl_env import GreenhouseEnv
+from plant_data import PLANT_DATA
+
+CONTROLLER_NAMES = ["mamdani", "sugeno", "evolved", "mpc"]
+
+# Tolerance band around the setpoint counted as "in band"
+TEMP_BAND = 2.0  # °C
+HUM_BAND = 5.0   # %
+
+METRICS = ['mean_temp_error', 'mean_hum_error', 'rmse_temp', 'rmse_hum', 'in_band_pct',
+           'mean_fan', 'mean_mist', 'mean_reward', 'runtime_s', 'ms_per_step']
+
+# Controllers are built once per worker process and reused across scenarios
+_controllers = {}
+_q_table_file = 'q_table.pkl'
+
+def init_worker(q_table_file):
+    global _q_table_file
+    _q_table_file = q_table_file
+
+def build_controller(name, scenario):
+    if name == "mpc":
+        # Setpoint and external conditions are part of the MPC model
+        from mpc_controller import MPCController
+        return MPCController(scenario['species'], scenario['stage'],
+                             ext_temp=scenario['ext_temp'], ext_hum=scenario['ext_hum'])
+    if name not in _controllers:
+        if name == "mamdani":
+            from mamdani_controller import MamdaniController
+            _controllers[name] = MamdaniController()
+        elif name == "sugeno":
+            from sugeno_controller import SugenoController
+            _controllers[name] = SugenoController()
+        elif name == "evolved":
+            # Same (pruned) rule base that main.py deploys
+            from sugeno_controller import SugenoController
+            from fuzzy_rl import FuzzyRLAgent
+            if not os.path.exists(_q_table_file):
+                # FuzzyRLAgent would silently start from an all-zero Q-table
+                raise FileNotFoundError(f"Q-table not found: {_q_table_file}")
+            sugeno = SugenoController()
+            FuzzyRLAgent(sugeno, q_table_file=_q_table_file).evolve_rules(prune=True)
+            _controllers[name] = sugeno
+        else:
+            raise ValueError(f"Unknown controller: {name}")
+    return _controllers[name]
+
+def run_scenario(scenario):
+    """Runs one closed-loop scenario and returns its metrics as a flat dict."""
+    target = PLANT_DATA[scenario['species']][scenario['stage']]
+    controller = build_controller(scenario['controller'], scenario)
+    env = GreenhouseEnv(ext_temp=scenario['ext_temp'], ext_hum=scenario['ext_hum'],
+                        optimal_temp=target["temp"], optimal_hum=target["hum"])
+
+    # Same seed for every controller -> identical initial states and noise
+    np.random.seed(scenario['seed'])
+    err_t, err_h, fans, mists, rewards = [], [], [], [], []
+    start = time.perf_counter()
+    for _ in range(scenario['episodes']):
+        temp, hum = env.reset()
+        for _ in range(scenario['steps']):
+            fan, mist = controller.compute(temp, hum)
+            (temp, hum), reward, _, _ = env.step(fan, mist)
+            err_t.append(temp - env.optimal_temp)
+            err_h.append(hum - env.optimal_hum)
+            fans.append(fan)
+            mists.append(mist)
+            rewards.append(reward)
+    runtime = time.perf_counter() - start
+
+    err_t = np.abs(err_t)
+    err_h = np.abs(err_h)
+    row = dict(scenario)
+    row.update({
+        'mean_temp_error': float(np.mean(err_t)),
+        'mean_hum_error': float(np.mean(err_h)),
+        'rmse_temp': float(np.sqrt(np.mean(err_t ** 2))),
+        'rmse_hum': float(np.sqrt(np.mean(err_h ** 2))),
+        'in_band_pct': 100.0 * float(np.mean((err_t <= TEMP_BAND) & (err_h <= HUM_BAND))),
+        'mean_fan': float(np.mean(fans)),
+        'mean_mist': float(np.mean(mists)),
+        'mean_reward': float(np.mean(rewards)),
+        'runtime_s': runtime,
+        'ms_per_step': 1000.0 * runtime / len(rewards),
+    })
+    return row
+
+def build_scenarios(controllers, ext_temps, ext_hums, episodes, steps, seed):
+    scenarios = []
+    conditions = list(itertools.product(ext_temps, ext_hums,
+                                        [(sp, st) for sp in PLANT_DATA for st in PLANT_DATA[sp]]))
+    for c_idx, (ext_temp, ext_hum, (species, stage)) in enumerate(conditions):
+        for name in controllers:
+            scenarios.append({
+                'controller': name, 'species': species, 'stage': stage,
+                'ext_temp': ext_temp, 'ext_hum': ext_hum,
+                'episodes': episodes, 'steps': steps, 'seed': seed + c_idx,
+            })
+    return scenarios
+
+def write_report(rows, output):
+    fields = list(rows[0].keys())
+    with open(output, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(rows)
+
+    # Per-controller summary averaged over all scenarios
+    lines = ["| controller | scenarios | " + " | ".join(METRICS) + " |",
+             "|---" * (len(METRICS) + 2) + "|"]
+    for name in dict.fromkeys(r['controller'] for r in rows):
+        subset = [r for r in rows if r['controller'] == name]
+        values = " | ".join(f"{np.mean([r[m] for r in subset]):.3f}" for m in METRICS)
+        lines.append(f"| {name} | {len(subset)} | {values} |")
+    summary = "\n".join(lines) + "\n"
+
+    summary_path = os.path.splitext(output)[0] + "_summary.md"
+    with open(summary_path, 'w') as f:
+        f.write(summary)
+    print(summary)
+    print(f"Report written to {output} and {summary_path}")
+
+def parse_floats(text):
+    return [float(v) for v in text.split(',') if v]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Parallel controller scenario sweep")
+    parser.add_argument("--controllers", default="mamdani,sugeno,evolved",
+                        help=f"Comma-separated subset of {','.join(CONTROLLER_NAMES)}")
+    parser.add_argument("--ext-temps", default="25,35,40", type=parse_floats, help="External temperatures (°C)")
+    parser.add_argument("--ext-hums", default="30,40,70", type=parse_floats, help="External humidities (%%)")
+    parser.add_argument("--episodes", default=3, type=int)
+    parser.add_argument("--steps", default=100, type=int)
+    parser.add_argument("--seed", default=0, type=int)
+    parser.add_argument("--workers", default=os.cpu_count(), type=int)
+    parser.add_argument("--output", default="sweep_report.csv")
+    parser.add_argument("--q-table", default="q_table.pkl", help="Trained Q-table for the 'evolved' controller")
+    args = parser.parse_args(argv)
+
+    controllers = [c for c in args.controllers.split(',') if c]
+    for name in controllers:
+        if name not in CONTROLLER_NAMES:
+            parser.error(f"unknown controller '{name}'")
+    if "evolved" in controllers and not os.path.exists(args.q_table):
+        parser.error(f"Q-table '{args.q_table}' not found (train one from main.py or pass --q-table)")
+
+    scenarios = build_scenarios(controllers, args.ext_temps, args.ext_hums,
+                                args.episodes, args.steps, args.seed)
+    print(f"Running {len(scenarios)} scenarios on {args.workers} workers...")
+
+    start = time.perf_counter()
+    rows = []
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=init_worker,
+                             initargs=(args.q_table,)) as executor:
+        for row in executor.map(run_scenario, scenarios):
+            rows.append(row)
+            if len(rows) % 10 == 0 or len(rows) == len(scenarios):
+                print(f"  {len(rows)}/{len(scenarios)} done")
+    print(f"Sweep finished in {time.perf_counter() - start:.1f} s")
+
+    write_report(rows, args.output)
+    return rows
+
+if __name__ == "__main__":
+    main()
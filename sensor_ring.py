@@ -0,0 +1,261 @@
+"""
+Shared-memory sensor ingress for multi-process deployments.
+
+An acquisition process writes fixed-layout (zone, timestamp, temp, hum) records into a
+single-producer / single-consumer ring buffer in multiprocessing.shared_memory. The
+controller process reads batches as zero-copy numpy views and writes (zone, timestamp,
+fan, mist) commands to a companion ring going the other way.
+
+    python sensor_ring.py   # local demo with a simulated GreenhouseEnv producer
+"""
+import sys
+import time
+import multiprocessing as mp
+from multiprocessing import shared_memory, resource_tracker
+import numpy as np
+
+# timestamp is time.perf_counter() taken by the acquisition process. perf_counter is a
+# monotonic clock shared by processes on the same host, so the controller can compute
+# reading -> command latency from it; readings from another host need their own clock.
+READING_DTYPE = np.dtype([('zone', '<u4'), ('timestamp', '<f8'), ('temp', '<f4'), ('hum', '<f4')])
+COMMAND_DTYPE = np.dtype([('zone', '<u4'), ('timestamp', '<f8'), ('fan', '<f4'), ('mist', '<f4')])
+
+CACHE_LINE = 64
+HEADER_BYTES = 2 * CACHE_LINE  # head and tail counters, one cache line each
+
+class ShmRing:
+    """
+    Single-producer / single-consumer ring of fixed-size records in shared memory.
+
+    The header holds two monotonically increasing uint64 counters in separate cache
+    lines (so producer and consumer don't contend on one line): `head` (records
+    written, only advanced by the producer) and `tail` (records consumed, only
+    advanced by the consumer). A record is written first and published by advancing
+    head after it.
+
+    numpy stores carry no memory-ordering guarantee of their own. On strongly ordered
+    CPUs (x86-64) stores become visible in program order, so the consumer never sees
+    head move past a partially written record. On weakly ordered CPUs (ARM) pass a
+    multiprocessing Lock shared by both sides: head/tail are then read and written
+    under it, and its acquire/release act as the memory barriers.
+    """
+
+    def __init__(self, name=None, capacity=4096, dtype=READING_DTYPE, create=True, lock=None):
+        self.dtype = np.dtype(dtype)
+        self.lock = lock
+        size = HEADER_BYTES + capacity * self.dtype.itemsize
+        if create:
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        elif sys.version_info >= (3, 13):
+            # Only the creator unlinks the segment, so attaching processes don't track it
+            self.shm = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+            if mp.parent_process() is None:
+                # An independent process has its own resource tracker, which would
+                # unlink the segment when it exits; only the creator should do that.
+                # (multiprocessing children share the creator's tracker.)
+                resource_tracker.unregister(self.shm._name, "shared_memory")
+        self.name = self.shm.name
+        self.capacity = capacity
+        self.owner = create
+
+        # Counter i lives at the start of cache line i
+        self._header = np.ndarray((2,), dtype='<u8', buffer=self.shm.buf, offset=0,
+                                  strides=(CACHE_LINE,))
+        self.records = np.ndarray((capacity,), dtype=self.dtype, buffer=self.shm.buf, offset=HEADER_BYTES)
+        if create:
+            self._header[:] = 0
+
+    @classmethod
+    def attach(cls, name, capacity, dtype=READING_DTYPE, lock=None):
+        return cls(name=name, capacity=capacity, dtype=dtype, create=False, lock=lock)
+
+    def _counters(self):
+        if self.lock is None:
+            return int(self._header[0]), int(self._header[1])
+        with self.lock:
+            return int(self._header[0]), int(self._header[1])
+
+    def _store(self, index, value):
+        if self.lock is None:
+            self._header[index] = value
+        else:
+            with self.lock:
+                self._header[index] = value
+
+    def __len__(self):
+        head, tail = self._counters()
+        return head - tail
+
+    def push(self, batch):
+        """Copies records into the ring; returns how many fitted (the rest is dropped)."""
+        head, tail = self._counters()
+        n = min(len(batch), self.capacity - (head - tail))
+        if n <= 0:
+            return 0
+        start = head % self.capacity
+        first = min(n, self.capacity - start)
+        self.records[start:start + first] = batch[:first]
+        if n > first:
+            self.records[:n - first] = batch[first:n]
+        self._store(0, head + n)  # publish
+        return n
+
+    def peek(self, max_records=None):
+        """
+        Zero-copy view of the oldest unread records, up to the wrap-around point.
+        Call release(len(view)) once the view has been processed.
+        """
+        head, tail = self._counters()
+        n = head - tail
+        if max_records is not None:
+            n = min(n, max_records)
+        start = tail % self.capacity
+        n = min(n, self.capacity - start)
+        return self.records[start:start + n]
+
+    def release(self, n):
+        # Only the consumer writes tail, so reading it back needs no lock
+        self._store(1, int(self._header[1]) + n)
+
+    def close(self):
+        # Views must be dropped before the mapping can be closed
+        self._header = None
+        self.records = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+def run_controller(reading_ring, command_ring, capacity, stop_event, stats=None, ready_event=None,
+                   controller_name="sugeno", temp_band=0.25, hum_band=0.5, locks=(None, None)):
+    """Controller process: reads reading batches, writes fan/mist commands."""
+    from deadband import DeadbandController
+    if controller_name == "mamdani":
+        from mamdani_controller import MamdaniController
+        controller = DeadbandController(MamdaniController(), temp_band, hum_band)
+    else:
+        from sugeno_controller import SugenoController
+        controller = DeadbandController(SugenoController(), temp_band, hum_band)
+
+    readings = ShmRing.attach(reading_ring, capacity, READING_DTYPE, locks[0])
+    commands = ShmRing.attach(command_ring, capacity, COMMAND_DTYPE, locks[1])
+    out = np.zeros(capacity, dtype=COMMAND_DTYPE)
+    processed, commands_dropped = 0, 0
+    latency_sum, latency_max = 0.0, 0.0  # running totals; the loop may run indefinitely
+    if ready_event is not None:
+        ready_event.set()
+    while not stop_event.is_set() or len(readings):
+        batch = readings.peek()
+        if len(batch) == 0:
+            time.sleep(0.0005)
+            continue
+        n = len(batch)
+        out['zone'][:n] = batch['zone']
+        out['timestamp'][:n] = batch['timestamp']
+        for k in range(n):
+            out['fan'][k], out['mist'][k] = controller.compute(float(batch['temp'][k]), float(batch['hum'][k]),
+                                                               zone=int(batch['zone'][k]))
+        del batch
+        readings.release(n)
+        commands_dropped += n - commands.push(out[:n])
+        latency = time.perf_counter() - out['timestamp'][:n]
+        latency_sum += float(latency.sum())
+        latency_max = max(latency_max, float(latency.max()))
+        processed += n
+
+    if stats is not None:
+        stats.update({'processed': processed, 'commands_dropped': commands_dropped, **controller.stats(),
+                      'mean_latency_ms': 1000 * latency_sum / processed if processed else float('nan'),
+                      'max_latency_ms': 1000 * latency_max})
+    readings.close()
+    commands.close()
+
+
+def run_simulated_producer(reading_ring, command_ring, capacity, n_zones, rate_hz, duration, stats=None, seed=0,
+                           locks=(None, None)):
+    """Acquisition process simulated with one GreenhouseEnv per zone, closing the loop on commands."""
+    from rl_env import GreenhouseEnv
+    np.random.seed(seed)
+    envs = [GreenhouseEnv() for _ in range(n_zones)]
+    state = np.array([env.reset() for env in envs])
+    actuators = np.zeros((n_zones, 2))  # latest (fan, mist) per zone
+
+    readings = ShmRing.attach(reading_ring, capacity, READING_DTYPE, locks[0])
+    commands = ShmRing.attach(command_ring, capacity, COMMAND_DTYPE, locks[1])
+    batch = np.zeros(n_zones, dtype=READING_DTYPE)
+    batch['zone'] = np.arange(n_zones)
+
+    sent, dropped = 0, 0
+    period = 1.0 / rate_hz
+    start = time.perf_counter()
+    next_tick = start
+    while time.perf_counter() - start < duration:
+        # Apply the newest commands from the controller
+        while True:
+            cmds = commands.peek()
+            if len(cmds) == 0:
+                break
+            actuators[cmds['zone'], 0] = cmds['fan']
+            actuators[cmds['zone'], 1] = cmds['mist']
+            n = len(cmds)
+            del cmds
+            commands.release(n)
+
+        for z, env in enumerate(envs):
+            state[z], _, _, _ = env.step(actuators[z, 0], actuators[z, 1])
+        batch['timestamp'] = time.perf_counter()
+        batch['temp'] = state[:, 0]
+        batch['hum'] = state[:, 1]
+        n = readings.push(batch)
+        sent += n
+        dropped += n_zones - n
+
+        next_tick += period
+        time.sleep(max(0.0, next_tick - time.perf_counter()))
+
+    if stats is not None:
+        stats.update({'sent': sent, 'dropped': dropped})
+    readings.close()
+    commands.close()
+
+
+def run_demo(n_zones=20, rate_hz=10, duration=5.0, capacity=8192):
+    """Runs the simulated producer and a controller process against each other."""
+    # Any start method works: perf_counter timestamps are comparable across processes
+    mp_ctx = mp.get_context()
+    # Locks make head/tail publication safe on weakly ordered CPUs too (see ShmRing)
+    locks = (mp_ctx.Lock(), mp_ctx.Lock())
+    readings = ShmRing(capacity=capacity, dtype=READING_DTYPE, lock=locks[0])
+    commands = ShmRing(capacity=capacity, dtype=COMMAND_DTYPE, lock=locks[1])
+    with mp_ctx.Manager() as manager:
+        producer_stats, controller_stats = manager.dict(), manager.dict()
+        stop, ready = mp_ctx.Event(), mp_ctx.Event()
+        controller = mp_ctx.Process(target=run_controller,
+                                    args=(readings.name, commands.name, capacity, stop, controller_stats, ready),
+                                    kwargs={'locks': locks})
+        producer = mp_ctx.Process(target=run_simulated_producer,
+                                  args=(readings.name, commands.name, capacity, n_zones, rate_hz, duration, producer_stats),
+                                  kwargs={'locks': locks})
+        controller.start()
+        ready.wait()  # controller has built its fuzzy system
+        producer.start()
+        producer.join()
+        stop.set()
+        controller.join()
+
+        p, c = dict(producer_stats), dict(controller_stats)
+    readings.close()
+    commands.close()
+
+    print(f"Zones: {n_zones} at {rate_hz} Hz for {duration:.0f} s")
+    print(f"Readings sent: {p['sent']} (dropped {p['dropped']}), processed: {c['processed']} "
+          f"(commands dropped {c['commands_dropped']})")
+    print(f"Inference executed: {c['executed']}, skipped by deadband: {c['skipped']} ({100 * c['skip_ratio']:.0f}%)")
+    print(f"Reading -> command latency: mean {c['mean_latency_ms']:.2f} ms, max {c['max_latency_ms']:.2f} ms")
+    return p, c
+
+
+if __name__ == "__main__":
+    run_demo()
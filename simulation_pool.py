@@ -0,0 +1,101 @@
+import copy
+import queue
+import time
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from skfuzzy import control as ctrl
+
+class SimulationPool:
+    """
+    Pool of independent ControlSystemSimulation instances for one ControlSystem.
+
+    skfuzzy keeps the 'current' input of every Antecedent on the Antecedent itself,
+    so two simulations built on the same ControlSystem still overwrite each other's
+    inputs. Each pooled simulation therefore runs on its own deep copy of the
+    system (universe and membership arrays are shared, not copied). Simulations
+    are created on demand, so the pool grows to the peak number of concurrent callers.
+    cache is passed to ControlSystemSimulation (result cache keyed by the inputs).
+    """
+
+    def __init__(self, system, cache=True):
+        self.system = system
+        self.cache = cache
+        self._idle = queue.SimpleQueue()
+
+    def __getstate__(self):
+        # Idle simulations are only a cache; a pickled pool (e.g. inside a controller
+        # sent to a worker process) starts empty and rebuilds them on demand
+        return {'system': self.system, 'cache': self.cache}
+
+    def __setstate__(self, state):
+        self.__init__(state['system'], state.get('cache', True))
+
+    def _new_simulation(self):
+        # Pre-seed the memo so deepcopy reuses the (read-only) numpy arrays
+        memo = {}
+        for var in self.system.fuzzy_variables:
+            memo[id(var.universe)] = var.universe
+            for term in var.terms.values():
+                memo[id(term.mf)] = term.mf
+        return ctrl.ControlSystemSimulation(copy.deepcopy(self.system, memo), cache=self.cache)
+
+    @contextmanager
+    def acquire(self):
+        try:
+            simulation = self._idle.get_nowait()
+        except queue.Empty:
+            simulation = self._new_simulation()
+        try:
+            yield simulation
+        finally:
+            self._idle.put(simulation)
+
+    def compute(self, inputs):
+        """Runs one inference on a pooled simulation and returns its outputs as a dict."""
+        with self.acquire() as simulation:
+            for label, value in inputs.items():
+                simulation.input[label] = value
+            # Cached runs update output in place, so drop keys left over from the last call
+            simulation.output.clear()
+            simulation.compute()
+            return dict(simulation.output)
+
+    def size(self):
+        """Number of idle simulations currently held by the pool."""
+        return self._idle.qsize()
+
+
+def benchmark_pool(compute, thread_counts=(1, 2, 4, 8), n_calls=2000):
+    """
+    Measures compute(temp, hum) throughput from a ThreadPoolExecutor and checks
+    every result against a serial reference run (detects corrupted inputs).
+    compute should not cache results: a cached simulation would answer the timed
+    runs from the reference run, and repeat a corrupted result as its own reference.
+    """
+    rng = np.random.default_rng(0)
+    temps = rng.uniform(0, 50, n_calls)
+    hums = rng.uniform(0, 100, n_calls)
+    reference = [compute(t, h) for t, h in zip(temps, hums)]
+
+    results = {}
+    for n_threads in thread_counts:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=n_threads) as executor:
+            outputs = list(executor.map(compute, temps, hums))
+        elapsed = time.perf_counter() - start
+        mismatches = sum(not np.allclose(a, b) for a, b in zip(outputs, reference))
+        results[n_threads] = {'calls_per_sec': n_calls / elapsed, 'mismatches': mismatches}
+        print(f"{n_threads} threads: {n_calls / elapsed:8.0f} calls/s, {mismatches} mismatched results")
+    return results
+
+
+if __name__ == "__main__":
+    from mamdani_controller import MamdaniController
+    from sugeno_controller import SugenoController
+
+    for name, controller in [("Mamdani", MamdaniController()), ("Sugeno", SugenoController())]:
+        # Uncached pool, so every timed call runs a full inference
+        controller.pool = SimulationPool(controller.system, cache=False)
+        print(f"--- {name} ---")
+        benchmark_pool(controller.compute)
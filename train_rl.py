@@ -1,9 +1,18 @@
+import sys
 from stable_baselines3 import PPO
-from rl_env import GreenhouseEnv
+from gym_env import GreenhouseGymEnv
+from policy_export import export_policy, check_parity
 
-env = GreenhouseEnv()
+# SB3 needs a Gymnasium env; GreenhouseEnv itself has no spaces
+env = GreenhouseGymEnv()
 
 model = PPO("MlpPolicy", env, verbose=1)
 model.learn(total_timesteps=5000)
 
 model.save("fuzzy_rl_agent")
+
+# Torch-free copy of the policy for deployment (see policy_export.NumpyPolicy)
+export_policy("fuzzy_rl_agent", "fuzzy_rl_agent_policy.npz")
+if not check_parity("fuzzy_rl_agent", "fuzzy_rl_agent_policy.npz"):
+    print("Exported policy does not match the SB3 model; do not deploy fuzzy_rl_agent_policy.npz.")
+    sys.exit(1)